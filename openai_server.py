@@ -135,14 +135,18 @@ class ModelRegistry:
         self._available: list[dict[str, str]] = []
         self._last_fetch: datetime | None = None
         self._refresh_interval = 3600  # 1 hour
+        # Kept across refreshes so its HTTP session is reused and the page can be revalidated (ETag / 304)
+        self._fetcher: PerplexityModelsFetcher | None = None
 
     def fetch(self, session_token: str) -> None:
         """Fetch available models from Perplexity."""
         logging.info("🔄 Fetching models from Perplexity...")
 
         try:
-            with PerplexityModelsFetcher(session_token) as fetcher:
-                self._models = fetcher.fetch_models()
+            if self._fetcher is None or self._fetcher.session_token != session_token:
+                self.close()
+                self._fetcher = PerplexityModelsFetcher(session_token)
+            self._models = self._fetcher.fetch_models()
 
             self._build_mappings()
             self._last_fetch = datetime.now()
@@ -274,6 +278,12 @@ class ModelRegistry:
         """Get list of available models."""
         return self._available
 
+    def close(self) -> None:
+        """Close the models fetcher and its HTTP session."""
+        if self._fetcher:
+            self._fetcher.close()
+            self._fetcher = None
+
     def needs_refresh(self) -> bool:
         """Check if models need refreshing."""
         if not self._last_fetch:
@@ -644,6 +654,7 @@ async def lifespan(app: FastAPI):
 
     await manager.stop_cleanup()
     manager.close()
+    models.close()
 
 
 app = FastAPI(
@@ -8,15 +8,18 @@ This script scrapes the actual available models instead of using a hardcoded lis
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
-import json
+import asyncio
+from dataclasses import dataclass
+from functools import lru_cache
 import re
 import sys
 from typing import Any
 
+from orjson import JSONDecodeError, loads
+
 
 try:
-    from curl_cffi.requests import Session
+    from curl_cffi.requests import AsyncSession, Response, Session
 except ImportError:
     print("Error: curl_cffi is required. Install it with: pip install curl_cffi")
     sys.exit(1)
@@ -35,8 +38,67 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# Endpoints that might contain model info, tried when the page yields none
+SETTINGS_ENDPOINTS = (
+    "/api/auth/session",
+    "/api/user/settings",
+)
+
+# Perplexity typically embeds model info in __NEXT_DATA__ or similar; the tags
+# are fixed literals, so the blob is located with plain substring searches
+_NEXT_DATA_START = b'<script id="__NEXT_DATA__" type="application/json">'
+_NEXT_DATA_END = b"</script>"
+
+# Common patterns for model IDs in Perplexity's other script tags, fused into
+# one alternation so the page is scanned once; exactly one group captures
+_MODEL_ID_PATTERN = re.compile(
+    rb'"identifier"\s*:\s*"([a-z0-9_]+)"'
+    rb'|"model"\s*:\s*"([a-z0-9_]+)"'
+    rb'|modelId["\']?\s*[:=]\s*["\']([a-z0-9_]+)["\']',
+    re.IGNORECASE,
+)
+
+# Known model ID prefixes, and common false positives that must never match;
+# both are matched against the lowercased ID
+_VALID_MODEL_ID_PATTERN = re.compile(
+    r"^(?:pplx_|gpt\d|claude|gemini|grok|sonar|experimental|kimi|llama|mistral|deepseek)"
+)
+_EXCLUDED_MODEL_ID_PATTERN = re.compile(r"^(?:api_|user_|session|token|auth|config)")
+
+# Lowercase model ID keywords: group 1 marks reasoning support, group 2 a Pro model
+_CAPABILITY_KEYWORD_PATTERN = re.compile(r"(thinking|reasoning)|(pro|alpha)")
+
+# Lowercase model ID prefix -> provider, checked in order
+_PROVIDER_PREFIXES = (
+    ("pplx", "Perplexity"),
+    ("gpt", "OpenAI"),
+    ("claude", "Anthropic"),
+    ("gemini", "Google"),
+    ("grok", "xAI"),
+    ("kimi", "Moonshot AI"),
+    ("llama", "Meta"),
+    ("mistral", "Mistral AI"),
+    ("deepseek", "DeepSeek"),
+)
+
+_MODEL_NAMES = {
+    "pplx_beta": "Perplexity Labs",
+    "pplx_alpha": "Perplexity Research",
+    "pplx_pro": "Perplexity Pro (Auto)",
+    "experimental": "Sonar",
+    "gpt51": "GPT-5.1",
+    "gpt52": "GPT-5.2",
+    "gpt51_thinking": "GPT-5.1 Thinking",
+    "claude45sonnet": "Claude 4.5 Sonnet",
+    "claude45sonnetthinking": "Claude 4.5 Sonnet Thinking",
+    "claudeopus45": "Claude Opus 4.5",
+    "gemini30pro": "Gemini 3.0 Pro Thinking",
+    "grok41nonreasoning": "Grok 4.1",
+    "kimik2thinking": "Kimi K2 Thinking",
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelInfo:
     """Information about a Perplexity model."""
     identifier: str
@@ -48,12 +110,111 @@ class ModelInfo:
     supports_reasoning: bool = False
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # All fields are flat, so asdict()'s recursive copy is unnecessary
+        return {
+            "identifier": self.identifier,
+            "name": self.name,
+            "description": self.description,
+            "mode": self.mode,
+            "provider": self.provider,
+            "is_pro": self.is_pro,
+            "supports_reasoning": self.supports_reasoning,
+        }
+
+
+# Known default models, used as fallback when nothing can be fetched
+_DEFAULT_MODELS: tuple[ModelInfo, ...] = (
+    ModelInfo("pplx_pro", "Perplexity Pro (Auto)", "Auto-selects the best model", "copilot", "Perplexity", True),
+    ModelInfo("pplx_alpha", "Perplexity Research", "Deep research mode", "copilot", "Perplexity", True),
+    ModelInfo("pplx_beta", "Perplexity Labs", "Experimental features", "copilot", "Perplexity", True),
+    ModelInfo("experimental", "Sonar", "Fast model for quick queries", "copilot", "Perplexity", False),
+    ModelInfo("gpt51", "GPT-5.1", "OpenAI's GPT-5.1", "copilot", "OpenAI", True),
+    ModelInfo("gpt52", "GPT-5.2", "OpenAI's GPT-5.2", "copilot", "OpenAI", True),
+    ModelInfo("gpt51_thinking", "GPT-5.1 Thinking", "GPT-5.1 with reasoning", "copilot", "OpenAI", True, True),
+    ModelInfo("claude45sonnet", "Claude 4.5 Sonnet", "Anthropic's Claude 4.5 Sonnet", "copilot", "Anthropic", True),
+    ModelInfo("claude45sonnetthinking", "Claude 4.5 Sonnet Thinking", "Claude 4.5 with reasoning", "copilot", "Anthropic", True, True),
+    ModelInfo("claudeopus45", "Claude Opus 4.5", "Anthropic's Claude Opus 4.5", "copilot", "Anthropic", True),
+    ModelInfo("gemini30pro", "Gemini 3.0 Pro Thinking", "Google's Gemini with reasoning", "copilot", "Google", True, True),
+    ModelInfo("grok41nonreasoning", "Grok 4.1", "xAI's Grok 4.1", "copilot", "xAI", True),
+    ModelInfo("kimik2thinking", "Kimi K2 Thinking", "Moonshot AI's Kimi K2", "copilot", "Moonshot AI", True, True),
+)
+
+
+# Model-id helpers are cached per argument, so raw JSON values must be checked
+# to be str before they are passed in (unhashable values raise TypeError)
+@lru_cache(maxsize=1024)
+def _is_valid_model_id(model_id: str) -> bool:
+    """Check if a string looks like a valid model identifier."""
+    model_id_lower = model_id.lower()
+    return (
+        len(model_id_lower) >= 3
+        and not _EXCLUDED_MODEL_ID_PATTERN.match(model_id_lower)
+        and bool(_VALID_MODEL_ID_PATTERN.match(model_id_lower))
+    )
+
+
+@lru_cache(maxsize=1024)
+def _create_model_info(model_id: str) -> ModelInfo:
+    """Create ModelInfo from a model identifier."""
+    name = _infer_model_name(model_id)
+    provider = _infer_provider(model_id)
+    is_pro, supports_reasoning = _infer_capabilities(model_id)
+
+    return ModelInfo(
+        identifier=model_id,
+        name=name,
+        description=f"{provider} model",
+        mode="copilot",
+        provider=provider,
+        is_pro=is_pro,
+        supports_reasoning=supports_reasoning,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _infer_model_name(model_id: str) -> str:
+    """Infer a human-readable name from model ID."""
+    return _MODEL_NAMES.get(model_id, model_id.replace("_", " ").title())
+
+
+@lru_cache(maxsize=1024)
+def _infer_provider(model_id: str) -> str:
+    """Infer the model provider from model ID."""
+    model_id_lower = model_id.lower()
+    if model_id_lower == "experimental":
+        return "Perplexity"
+
+    for prefix, provider in _PROVIDER_PREFIXES:
+        if model_id_lower.startswith(prefix):
+            return provider
+    return "Unknown"
+
+
+@lru_cache(maxsize=1024)
+def _infer_capabilities(model_id: str) -> tuple[bool, bool]:
+    """Infer (is_pro, supports_reasoning) from keywords in a model ID, in a single scan."""
+    is_pro = supports_reasoning = False
+    for match in _CAPABILITY_KEYWORD_PATTERN.finditer(model_id.lower()):
+        if match.lastindex == 1:
+            supports_reasoning = True
+        else:
+            is_pro = True
+    return is_pro, supports_reasoning
 
 
 class PerplexityModelsFetcher:
     """Fetches available models from Perplexity's web interface."""
 
+    __slots__ = (
+        "_async_session",
+        "_etag",
+        "_last_modified",
+        "_models",
+        "_models_by_id",
+        "_session",
+        "session_token",
+    )
+
     def __init__(self, session_token: str):
         """Initialize the fetcher with a session token.
         
@@ -62,195 +223,138 @@ class PerplexityModelsFetcher:
         """
         self.session_token = session_token
         self._session: Session | None = None
+        self._async_session: AsyncSession | None = None
         self._models: list[ModelInfo] = []
+        self._models_by_id: dict[str, ModelInfo] = {}
+        # Validators of the page the current models were parsed from
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+
+    def _session_options(self) -> dict[str, Any]:
+        """Build the options shared by the sync and async HTTP sessions."""
+        return {
+            "headers": {
+                **DEFAULT_HEADERS,
+                "Referer": f"{API_BASE_URL}/",
+                "Origin": API_BASE_URL,
+            },
+            "cookies": {SESSION_COOKIE_NAME: self.session_token},
+            "timeout": 30,
+            "impersonate": "chrome",
+        }
 
     def _get_session(self) -> Session:
         """Get or create HTTP session."""
         if self._session is None:
-            self._session = Session(
-                headers={
-                    **DEFAULT_HEADERS,
-                    "Referer": f"{API_BASE_URL}/",
-                    "Origin": API_BASE_URL,
-                },
-                cookies={SESSION_COOKIE_NAME: self.session_token},
-                timeout=30,
-                impersonate="chrome",
-            )
+            self._session = Session(**self._session_options())
         return self._session
 
-    def _extract_models_from_html(self, html: str) -> list[ModelInfo]:
-        """Extract model information from the page HTML/JS."""
+    def _get_async_session(self) -> AsyncSession:
+        """Get or create the async HTTP session."""
+        if self._async_session is None:
+            self._async_session = AsyncSession(**self._session_options())
+        return self._async_session
+
+    def _set_models(self, models: list[ModelInfo], response: Response | None = None) -> None:
+        """Store fetched models and rebuild the identifier index.
+
+        Args:
+            models: Models to store
+            response: Page response the models came from, if any; its cache
+                validators are kept so the next fetch can be conditional
+        """
+        self._models = models
+        # Reversed so the first model with a given identifier wins
+        self._models_by_id = {model.identifier: model for model in reversed(models)}
+
+        if response is None:
+            self._etag = self._last_modified = None
+        else:
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+
+    def _conditional_headers(self) -> dict[str, str]:
+        """Build revalidation headers for the page the current models came from."""
+        headers: dict[str, str] = {}
+        if not self._models:
+            return headers
+
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _extract_models_from_html(self, html: bytes) -> list[ModelInfo]:
+        """Extract model information from the raw page HTML/JS.
+
+        The page is scanned as bytes, since every pattern is ASCII; only the
+        matched model IDs are decoded.
+        """
         models: list[ModelInfo] = []
 
-        # Pattern to find model configurations in the JavaScript
-        # Perplexity typically embeds model info in __NEXT_DATA__ or similar
-        next_data_pattern = r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>'
-        next_data_match = re.search(next_data_pattern, html, re.DOTALL)
+        next_data = b""
+        start = html.find(_NEXT_DATA_START)
+        if start != -1:
+            start += len(_NEXT_DATA_START)
+            end = html.find(_NEXT_DATA_END, start)
+            if end != -1:
+                next_data = html[start:end]
 
-        if next_data_match:
+        # Only parse and walk __NEXT_DATA__ if it can contain a model definition at all
+        if b'"identifier"' in next_data or b'"modelId"' in next_data:
             try:
-                data = json.loads(next_data_match.group(1))
+                data = loads(next_data)
                 models.extend(self._parse_next_data(data))
-            except json.JSONDecodeError:
+            except JSONDecodeError:
                 pass
 
-        # Also look for model identifiers in other script tags
-        # Common patterns for model IDs in Perplexity
-        model_patterns = [
-            # Match model identifier patterns
-            r'"identifier"\s*:\s*"([a-z0-9_]+)"',
-            r'"model"\s*:\s*"([a-z0-9_]+)"',
-            r'modelId["\']?\s*[:=]\s*["\']([a-z0-9_]+)["\']',
-        ]
-
-        found_ids = set()
-        for pattern in model_patterns:
-            for match in re.finditer(pattern, html, re.IGNORECASE):
-                model_id = match.group(1)
-                if self._is_valid_model_id(model_id):
-                    found_ids.add(model_id)
-
-        # Add any newly found models
-        existing_ids = {m.identifier for m in models}
-        for model_id in found_ids:
-            if model_id not in existing_ids:
-                models.append(self._create_model_info(model_id))
+        # The page-wide scan is only a fallback for when __NEXT_DATA__ has no models
+        if models:
+            return models
 
-        return models
+        # Look for model identifiers in other script tags; dedupe before validating
+        found_ids = {match.group(match.lastindex).decode("ascii") for match in _MODEL_ID_PATTERN.finditer(html)}
+        return [_create_model_info(model_id) for model_id in found_ids if _is_valid_model_id(model_id)]
 
-    def _parse_next_data(self, data: dict) -> list[ModelInfo]:
+    def _parse_next_data(self, data: Any) -> list[ModelInfo]:
         """Parse __NEXT_DATA__ JSON for model information."""
         models: list[ModelInfo] = []
 
-        # Recursively search for model configurations
-        def search_dict(d: dict, depth: int = 0) -> None:
-            if depth > 10:  # Prevent infinite recursion
-                return
-
-            for key, value in d.items():
-                if isinstance(value, dict):
-                    # Check if this looks like a model definition
-                    if "identifier" in value or "modelId" in value:
-                        model_id = value.get("identifier") or value.get("modelId")
-                        if model_id and self._is_valid_model_id(model_id):
-                            models.append(ModelInfo(
-                                identifier=model_id,
-                                name=value.get("name", model_id),
-                                description=value.get("description", ""),
-                                mode=value.get("mode", "copilot"),
-                                provider=value.get("provider", "unknown"),
-                                is_pro=value.get("isPro", False),
-                                supports_reasoning="thinking" in model_id.lower() or "reasoning" in model_id.lower(),
-                            ))
-                    search_dict(value, depth + 1)
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            search_dict(item, depth + 1)
-
-        search_dict(data)
-        return models
+        # Walk the tree with an explicit stack; children are pushed in reverse
+        # so models come out in document order. Containers already seen are
+        # skipped, which guards against cycles without limiting depth
+        stack: list[Any] = [data]
+        visited: set[int] = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
 
-    def _is_valid_model_id(self, model_id: str) -> bool:
-        """Check if a string looks like a valid model identifier."""
-        if not model_id or len(model_id) < 3:
-            return False
-
-        # Known model ID patterns
-        valid_patterns = [
-            r'^pplx_',
-            r'^gpt\d',
-            r'^claude',
-            r'^gemini',
-            r'^grok',
-            r'^sonar',
-            r'^experimental',
-            r'^kimi',
-            r'^llama',
-            r'^mistral',
-            r'^deepseek',
-        ]
-
-        # Exclude common false positives
-        exclude_patterns = [
-            r'^api_',
-            r'^user_',
-            r'^session',
-            r'^token',
-            r'^auth',
-            r'^config',
-        ]
-
-        for pattern in exclude_patterns:
-            if re.match(pattern, model_id, re.IGNORECASE):
-                return False
-
-        for pattern in valid_patterns:
-            if re.match(pattern, model_id, re.IGNORECASE):
-                return True
-
-        return False
-
-    def _create_model_info(self, model_id: str) -> ModelInfo:
-        """Create ModelInfo from a model identifier."""
-        name = self._infer_model_name(model_id)
-        provider = self._infer_provider(model_id)
-
-        return ModelInfo(
-            identifier=model_id,
-            name=name,
-            description=f"{provider} model",
-            mode="copilot",
-            provider=provider,
-            is_pro="pro" in model_id.lower() or "alpha" in model_id.lower(),
-            supports_reasoning="thinking" in model_id.lower() or "reasoning" in model_id.lower(),
-        )
+            if isinstance(node, list):
+                stack.extend(item for item in reversed(node) if isinstance(item, (dict, list)))
+                continue
+            if not isinstance(node, dict):
+                continue
 
-    def _infer_model_name(self, model_id: str) -> str:
-        """Infer a human-readable name from model ID."""
-        name_mappings = {
-            "pplx_beta": "Perplexity Labs",
-            "pplx_alpha": "Perplexity Research",
-            "pplx_pro": "Perplexity Pro (Auto)",
-            "experimental": "Sonar",
-            "gpt51": "GPT-5.1",
-            "gpt52": "GPT-5.2",
-            "gpt51_thinking": "GPT-5.1 Thinking",
-            "claude45sonnet": "Claude 4.5 Sonnet",
-            "claude45sonnetthinking": "Claude 4.5 Sonnet Thinking",
-            "claudeopus45": "Claude Opus 4.5",
-            "gemini30pro": "Gemini 3.0 Pro Thinking",
-            "grok41nonreasoning": "Grok 4.1",
-            "kimik2thinking": "Kimi K2 Thinking",
-        }
+            # Check if this looks like a model definition
+            if "identifier" in node or "modelId" in node:
+                model_id = node.get("identifier") or node.get("modelId")
+                if isinstance(model_id, str) and _is_valid_model_id(model_id):
+                    models.append(ModelInfo(
+                        identifier=model_id,
+                        name=node.get("name", model_id),
+                        description=node.get("description", ""),
+                        mode=node.get("mode", "copilot"),
+                        provider=node.get("provider", "unknown"),
+                        is_pro=node.get("isPro", False),
+                        supports_reasoning=_infer_capabilities(model_id)[1],
+                    ))
+
+            stack.extend(value for value in reversed(node.values()) if isinstance(value, (dict, list)))
 
-        return name_mappings.get(model_id, model_id.replace("_", " ").title())
-
-    def _infer_provider(self, model_id: str) -> str:
-        """Infer the model provider from model ID."""
-        model_id_lower = model_id.lower()
-
-        if model_id_lower.startswith("pplx") or model_id_lower == "experimental":
-            return "Perplexity"
-        elif model_id_lower.startswith("gpt"):
-            return "OpenAI"
-        elif model_id_lower.startswith("claude"):
-            return "Anthropic"
-        elif model_id_lower.startswith("gemini"):
-            return "Google"
-        elif model_id_lower.startswith("grok"):
-            return "xAI"
-        elif model_id_lower.startswith("kimi"):
-            return "Moonshot AI"
-        elif model_id_lower.startswith("llama"):
-            return "Meta"
-        elif model_id_lower.startswith("mistral"):
-            return "Mistral AI"
-        elif model_id_lower.startswith("deepseek"):
-            return "DeepSeek"
-        else:
-            return "Unknown"
+        return models
 
     def fetch_models(self) -> list[ModelInfo]:
         """Fetch available models from Perplexity.
@@ -262,93 +366,151 @@ class PerplexityModelsFetcher:
 
         # Fetch the main page to get model information
         try:
-            response = session.get(API_BASE_URL)
-            response.raise_for_status()
-
-            models = self._extract_models_from_html(response.text)
+            response = session.get(API_BASE_URL, headers=self._conditional_headers())
+            page_models = self._models_from_page(response)
+            if page_models is None:
+                return self._models
 
             # If we didn't find models from HTML, try the settings/API endpoint
-            if not models:
-                models = self._fetch_from_settings()
+            settings_models = [] if page_models else self._fetch_from_settings()
+            return self._store_models(page_models, settings_models, response)
 
-            # If still no models, use known defaults
-            if not models:
-                models = self._get_default_models()
+        except Exception as e:
+            return self._store_default_models(e)
 
-            self._models = models
-            return models
+    async def fetch_models_async(self) -> list[ModelInfo]:
+        """Fetch available models from Perplexity without blocking the event loop.
+
+        The fetcher keeps one AsyncSession across calls, so repeated fetches
+        reuse its connections; the settings endpoints are requested
+        concurrently. Call it from a single event loop and release the
+        session with :meth:`aclose` (or ``async with``).
+
+        Returns:
+            List of available models
+        """
+        session = self._get_async_session()
+
+        try:
+            response = await session.get(API_BASE_URL, headers=self._conditional_headers())
+            page_models = self._models_from_page(response)
+            if page_models is None:
+                return self._models
+
+            # If we didn't find models from HTML, try the settings/API endpoint
+            settings_models = [] if page_models else await self._fetch_from_settings_async(session)
+            return self._store_models(page_models, settings_models, response)
 
         except Exception as e:
-            print(f"Error fetching models: {e}", file=sys.stderr)
-            # Return default models on error
-            self._models = self._get_default_models()
-            return self._models
+            return self._store_default_models(e)
+
+    def _models_from_page(self, response: Response) -> list[ModelInfo] | None:
+        """Extract models from the main page response.
+
+        Returns:
+            Models found in the page, or None if the page is unchanged since
+            the last fetch and the stored models still apply
+        """
+        # Page unchanged since the last fetch, so neither are the models parsed from it
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        return self._extract_models_from_html(response.content)
+
+    def _store_models(
+        self,
+        page_models: list[ModelInfo],
+        settings_models: list[ModelInfo],
+        response: Response,
+    ) -> list[ModelInfo]:
+        """Store the result of a page fetch, falling back to settings models and then known defaults.
+
+        Only models parsed from the page keep its cache validators. Fallback
+        models drop them, so the next fetch downloads the page again instead of
+        pinning the fallback behind a 304.
+        """
+        if page_models:
+            self._set_models(page_models, response)
+        else:
+            self._set_models(settings_models or self._get_default_models())
+        return self._models
+
+    def _store_default_models(self, error: Exception) -> list[ModelInfo]:
+        """Report a failed fetch and store the known default models instead."""
+        print(f"Error fetching models: {error}", file=sys.stderr)
+        self._set_models(self._get_default_models())
+        return self._models
 
     def _fetch_from_settings(self) -> list[ModelInfo]:
         """Try to fetch models from settings or API endpoints."""
         session = self._get_session()
         models: list[ModelInfo] = []
 
-        # Try various endpoints that might contain model info
-        endpoints = [
-            "/api/auth/session",
-            "/api/user/settings",
-        ]
-
-        for endpoint in endpoints:
+        for endpoint in SETTINGS_ENDPOINTS:
             try:
                 response = session.get(f"{API_BASE_URL}{endpoint}")
-                if response.status_code == 200:
-                    data = response.json()
-                    # Look for model information in the response
-                    if isinstance(data, dict):
-                        for key in ["models", "availableModels", "supportedModels"]:
-                            if key in data:
-                                model_list = data[key]
-                                if isinstance(model_list, list):
-                                    for m in model_list:
-                                        if isinstance(m, str):
-                                            models.append(self._create_model_info(m))
-                                        elif isinstance(m, dict) and "identifier" in m:
-                                            models.append(ModelInfo(
-                                                identifier=m["identifier"],
-                                                name=m.get("name", m["identifier"]),
-                                                description=m.get("description", ""),
-                                                mode=m.get("mode", "copilot"),
-                                                provider=self._infer_provider(m["identifier"]),
-                                            ))
+                models.extend(self._parse_settings_response(response))
+            except Exception:
+                continue
+
+        return models
+
+    async def _fetch_from_settings_async(self, session: AsyncSession) -> list[ModelInfo]:
+        """Request all settings endpoints concurrently and collect their models."""
+        responses = await asyncio.gather(
+            *(session.get(f"{API_BASE_URL}{endpoint}") for endpoint in SETTINGS_ENDPOINTS),
+            return_exceptions=True,
+        )
+        models: list[ModelInfo] = []
+
+        for response in responses:
+            if isinstance(response, BaseException):
+                continue
+            try:
+                models.extend(self._parse_settings_response(response))
             except Exception:
                 continue
 
         return models
 
+    def _parse_settings_response(self, response: Response) -> list[ModelInfo]:
+        """Extract models from a settings/API endpoint response."""
+        models: list[ModelInfo] = []
+        if response.status_code != 200:
+            return models
+
+        data = response.json()
+        # Look for model information in the response
+        if isinstance(data, dict):
+            for key in ["models", "availableModels", "supportedModels"]:
+                if key in data:
+                    model_list = data[key]
+                    if isinstance(model_list, list):
+                        for m in model_list:
+                            if isinstance(m, str):
+                                models.append(_create_model_info(m))
+                            elif isinstance(m, dict) and isinstance(m.get("identifier"), str):
+                                models.append(ModelInfo(
+                                    identifier=m["identifier"],
+                                    name=m.get("name", m["identifier"]),
+                                    description=m.get("description", ""),
+                                    mode=m.get("mode", "copilot"),
+                                    provider=_infer_provider(m["identifier"]),
+                                ))
+
+        return models
+
     def _get_default_models(self) -> list[ModelInfo]:
         """Return known default models as fallback."""
-        return [
-            ModelInfo("pplx_pro", "Perplexity Pro (Auto)", "Auto-selects the best model", "copilot", "Perplexity", True),
-            ModelInfo("pplx_alpha", "Perplexity Research", "Deep research mode", "copilot", "Perplexity", True),
-            ModelInfo("pplx_beta", "Perplexity Labs", "Experimental features", "copilot", "Perplexity", True),
-            ModelInfo("experimental", "Sonar", "Fast model for quick queries", "copilot", "Perplexity", False),
-            ModelInfo("gpt51", "GPT-5.1", "OpenAI's GPT-5.1", "copilot", "OpenAI", True),
-            ModelInfo("gpt52", "GPT-5.2", "OpenAI's GPT-5.2", "copilot", "OpenAI", True),
-            ModelInfo("gpt51_thinking", "GPT-5.1 Thinking", "GPT-5.1 with reasoning", "copilot", "OpenAI", True, True),
-            ModelInfo("claude45sonnet", "Claude 4.5 Sonnet", "Anthropic's Claude 4.5 Sonnet", "copilot", "Anthropic", True),
-            ModelInfo("claude45sonnetthinking", "Claude 4.5 Sonnet Thinking", "Claude 4.5 with reasoning", "copilot", "Anthropic", True, True),
-            ModelInfo("claudeopus45", "Claude Opus 4.5", "Anthropic's Claude Opus 4.5", "copilot", "Anthropic", True),
-            ModelInfo("gemini30pro", "Gemini 3.0 Pro Thinking", "Google's Gemini with reasoning", "copilot", "Google", True, True),
-            ModelInfo("grok41nonreasoning", "Grok 4.1", "xAI's Grok 4.1", "copilot", "xAI", True),
-            ModelInfo("kimik2thinking", "Kimi K2 Thinking", "Moonshot AI's Kimi K2", "copilot", "Moonshot AI", True, True),
-        ]
+        return list(_DEFAULT_MODELS)
 
     def get_model_by_id(self, model_id: str) -> ModelInfo | None:
         """Get a model by its identifier."""
         if not self._models:
             self.fetch_models()
 
-        for model in self._models:
-            if model.identifier == model_id:
-                return model
-        return None
+        return self._models_by_id.get(model_id)
 
     def close(self) -> None:
         """Close the HTTP session."""
@@ -362,6 +524,19 @@ class PerplexityModelsFetcher:
     def __exit__(self, *args) -> None:
         self.close()
 
+    async def aclose(self) -> None:
+        """Close the async HTTP session, and the sync one if it was used."""
+        if self._async_session:
+            await self._async_session.close()
+            self._async_session = None
+        self.close()
+
+    async def __aenter__(self) -> PerplexityModelsFetcher:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
 
 def get_available_models(session_token: str) -> list[ModelInfo]:
     """Convenience function to fetch available models.